@@ -2,17 +2,25 @@
 
 import argparse
 import json
+import logging
+import os
+import sys
 from collections import defaultdict
 from datetime import datetime
 
 import pandas as pd
 
 from .analyzer import RepoAnalyzer
-from .github_utils import *
+from .github_utils import (
+    check_github_repo_exists,
+    check_github_repos_exist,
+    check_rate_limit,
+    validate_repo_format,
+    validate_repo_formats,
+    validate_token,
+)
 from .output_handler import OutputHandler
 
-import logging
-
 # logging 모듈 기본 설정 (analyzer.py와 동일한 설정)
 logging.basicConfig(
     stream=sys.stdout,
@@ -268,12 +276,15 @@ def main() -> None:
         [r.strip() for repo in repositories for r in repo.split(",") if r.strip()]
     ))
 
-    # 각 저장소 유효성 검사 (먼저 다 검사)
-    for repo in final_repositories:
-        if not validate_repo_format(repo):
+    # 각 저장소 유효성 검사 (먼저 다 검사) — 형식 검증은 정규식 한 번으로 일괄 처리
+    for repo, ok in validate_repo_formats(final_repositories).items():
+        if not ok:
             logger.error(f"오류: 저장소 '{repo}'는 'owner/repo' 형식으로 입력해야 합니다. 예) 'oss2025hnu/reposcore-py'")
             sys.exit(1)
-        if not check_github_repo_exists(repo):
+
+    # 존재 여부는 병렬로 한 번에 확인
+    for repo, exists in check_github_repos_exist(final_repositories).items():
+        if not exists:
             logger.warning(f"입력한 저장소 '{repo}'가 깃허브에 존재하지 않을 수 있음.")
             sys.exit(1)
 
@@ -304,10 +315,14 @@ def main() -> None:
             logger.error("❌ 학기 시작일 형식이 잘못되었습니다. YYYY-MM-DD 형식으로 입력해 주세요.")
             sys.exit(1)
 
+    # 핸들러는 루프 밖에서 한 번만 생성: 테마는 저장소 간 동일하고, 이렇게 해야
+    # 재사용 Figure가 전체 실행에 하나만 존재하며(끝의 close_figures()가 전부 해제)
+    # 보고서의 '분석 기준 시각'도 배치당 한 번으로 고정된다
+    output_handler = OutputHandler(theme=args.theme)
+
     for repo in tqdm(final_repositories, desc="저장소 분석 진행"):
 
         analyzer = RepoAnalyzer(repo, theme=args.theme)
-        output_handler = OutputHandler(theme=args.theme)
 
         if args.weekly_chart:
             if not args.semester_start:
@@ -328,31 +343,36 @@ def main() -> None:
 
         cache_update_required = os.path.exists(cache_path) and analyzer.is_cache_update_required(cache_path)
 
-        if args.use_cache and os.path.exists(cache_path) and not cache_update_required:
-            logger.info(f"✅ 캐시 파일({cache_file_name})이 존재합니다. 캐시에서 데이터를 불러옵니다.")
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cached_json = json.load(f)
-                analyzer.participants = cached_json['participants']
-                analyzer.previous_create_at = cached_json['update_time']
-        else:
-            if args.use_cache and cache_update_required:
+        try:
+            if args.use_cache and os.path.exists(cache_path) and not cache_update_required:
+                # 신선한(1시간 이내) 캐시: 불러온 뒤 마지막 수집 시점 이후 '생성'된 항목만 증분 수집합니다.
+                # 생성 기준 증분은 그 사이의 병합/닫힘 같은 상태 변화를 보지 못하므로,
+                # 캐시가 1시간을 넘기면 아래 분기에서 전체를 다시 수집해 바로잡습니다.
+                logger.info(f"✅ 캐시 파일({cache_file_name})이 존재합니다. 캐시에 이어서 증분 수집합니다.")
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cached_json = json.load(f)
+                analyzer.participants = cached_json.get('participants', {})
+                if cached_json.get('update_time'):
+                    analyzer.previous_create_at = cached_json['update_time']
+                for week_str, data in cached_json.get('weekly_activity', {}).items():
+                    analyzer.weekly_activity[int(week_str)].update(data)
+            elif args.use_cache and cache_update_required:
                 if args.verbose:
-                    logger.info(f"🔄 리포지토리의 최근 이슈 생성 시간이 캐시파일의 생성 시간보다 최근입니다. GitHub API로 데이터를 수집합니다.")
+                    logger.info(f"🔄 캐시가 1시간을 넘겨 전체를 다시 수집합니다. (캐시 반영 이후의 병합/닫힘 상태 변화 반영)")
             else:
                 if args.verbose:
                     logger.info(f"�� 캐시를 사용하지 않거나 캐시 파일({cache_file_name})이 없습니다. GitHub API로 데이터를 수집합니다.")
-            try:
-                analyzer.collect_PRs_and_issues()
-                if not getattr(analyzer, "_data_collected", True):
-                    logger.error("❌ GitHub API 요청에 실패했습니다. 결과 파일을 생성하지 않고 건너뜁니다.")
-                    logger.error("ℹ️ 인증 없이 실행한 경우 요청 횟수 제한(403)일 수 있습니다. --token 옵션을 사용해보세요.")
-                    continue  # <<<< 다음 저장소로 진행
-                with open(cache_path, "w", encoding="utf-8") as f:
-                    json.dump({'update_time':analyzer.previous_create_at, 'participants': analyzer.participants, 'weekly_activity': dict(analyzer.weekly_activity)}, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                logger.error(f"❌ {repo} 저장소 분석 중 예외 발생: {e}")
-                logger.error("해당 저장소를 건너뜁니다.")
-                continue
+            analyzer.collect_PRs_and_issues()
+            if not getattr(analyzer, "_data_collected", True):
+                logger.error("❌ GitHub API 요청에 실패했습니다. 결과 파일을 생성하지 않고 건너뜁니다.")
+                logger.error("ℹ️ 인증 없이 실행한 경우 요청 횟수 제한(403)일 수 있습니다. --token 옵션을 사용해보세요.")
+                continue  # <<<< 다음 저장소로 진행
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump({'update_time':analyzer.previous_create_at, 'participants': analyzer.participants, 'weekly_activity': dict(analyzer.weekly_activity)}, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"❌ {repo} 저장소 분석 중 예외 발생: {e}")
+            logger.error("해당 저장소를 건너뜁니다.")
+            continue
 
         try:
             # 1) 사용자 정보 로드 (없으면 None)
@@ -504,19 +524,10 @@ def main() -> None:
 
         # 정렬
         user_scores = defaultdict(dict, sorted(user_scores.items(), key=lambda x: x[1]['total'], reverse=True))
-        # rank 추가
-        current_rank = 1
-        prev_score = None
-
-        for i, (username, scores) in enumerate(user_scores.items()):
-            current_score = scores['total']
-            
-            # 동점자 처리
-            if prev_score is not None and current_score != prev_score:
-                current_rank = i + 1
-            
-            user_scores[username]['rank'] = current_rank
-            prev_score = current_score
+        # rank 추가 (동점자는 같은 등수, generate_overall_repository_csv와 동일한 방식)
+        totals = pd.Series({username: scores['total'] for username, scores in user_scores.items()})
+        for username, rank in totals.rank(method='min', ascending=False).astype(int).items():
+            user_scores[username]['rank'] = rank
 
         # 통합 결과 저장
         overall_output_dir = os.path.join(args.output, "overall")
@@ -662,6 +673,9 @@ def main() -> None:
         output_handler.generate_html_report(all_repo_html_data, args.output)
         logger.info("HTML 보고서 생성 완료")
 
+    # 차트 생성에 재사용하던 matplotlib Figure 해제
+    output_handler.close_figures()
+
 
 
 if __name__ == "__main__":
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
+import bisect
 import json
+import logging
+import os
+import sys
 from collections import defaultdict
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
-from .github_utils import *
+from .github_utils import check_github_repo_exists, retry_request
+from .retry_decorator import build_session
 from .theme_manager import ThemeManager
 
 ERROR_MESSAGES = {
@@ -21,28 +26,36 @@ ERROR_MESSAGES = {
 
 logger = logging.getLogger(__name__)
 
+# 참여자별 활동 카운트 초기값 템플릿 (새 참여자 등장 시 복사해서 사용)
+_EMPTY_COUNTS = {
+    'p_enhancement': 0,
+    'p_bug': 0,
+    'p_documentation': 0,
+    'p_typo': 0,
+    'i_enhancement': 0,
+    'i_bug': 0,
+    'i_documentation': 0,
+}
+
+
+# 점수 구간별 이모지 테이블 (10점 단위, 낮은 구간부터)
+_EMOJI_THRESHOLDS = (10, 20, 30, 40, 50, 60, 70, 80, 90)
+_EMOJIS = (
+    "🌑",  # 최소 참여
+    "🍁",  # 참여 시작
+    "🍂",  # 개선 필요
+    "🌿",  # 초기 단계
+    "🍀",  # 발전 가능성
+    "🌱",  # 성장 중
+    "🎨",  # 양호한 성과
+    "🎯",  # 목표 달성
+    "⭐",  # 탁월한 성과
+    "🌟",  # 최상위 성과
+)
+
 
 def get_emoji(score):
-    if score >= 90:
-        return "🌟"  # 최상위 성과
-    elif score >= 80:
-        return "⭐"  # 탁월한 성과
-    elif score >= 70:
-        return "🎯"  # 목표 달성
-    elif score >= 60:
-        return "🎨"  # 양호한 성과
-    elif score >= 50:
-        return "🌱"  # 성장 중
-    elif score >= 40:
-        return "🍀"  # 발전 가능성
-    elif score >= 30:
-        return "🌿"  # 초기 단계
-    elif score >= 20:
-        return "🍂"  # 개선 필요
-    elif score >= 10:
-        return "🍁"  # 참여 시작
-    else:
-        return "🌑"  # 최소 참여
+    return _EMOJIS[bisect.bisect_right(_EMOJI_THRESHOLDS, score)]
 
 
 class RepoAnalyzer:
@@ -89,18 +102,20 @@ class RepoAnalyzer:
         self.__previous_create_at = None
 
         # 환경변수에서 토큰을 읽어서 세션 설정
-        self.SESSION = requests.Session()
+        self.SESSION = build_session()
         token = os.getenv('GITHUB_TOKEN')
         if token:
             self.SESSION.headers.update({
                 'Authorization': f'Bearer {token}',
                 'Accept': 'application/vnd.github+json',
+                'Accept-Encoding': 'gzip',
                 'User-Agent': 'reposcore-py'
             })
         else:
             # 토큰이 없어도 표준 헤더는 설정
             self.SESSION.headers.update({
                 'Accept': 'application/vnd.github+json',
+                'Accept-Encoding': 'gzip',
                 'User-Agent': 'reposcore-py'
             })
 
@@ -153,6 +168,14 @@ class RepoAnalyzer:
         page = 1
         per_page = 100
 
+        # 캐시에서 불러온 마지막 수집 시점. 생성일 내림차순으로 요청하므로
+        # 이 시점 이전 항목을 만나면 나머지는 이미 집계된 데이터다.
+        # 주의: 생성일 기준이라 cutoff 이전 항목의 이후 상태 변화(병합/닫힘)는
+        # 여기서 보이지 않는다. 호출부(__main__)가 1시간 넘은 캐시를 전체
+        # 재수집으로 돌려 이 오차의 창을 1시간 이내로 묶는다.
+        cutoff = self.__previous_create_at
+        reached_cached = False
+
         while True:
             url = f"https://api.github.com/repos/{self.repo_path}/issues"
 
@@ -161,7 +184,9 @@ class RepoAnalyzer:
                                      params={
                                          'state': 'all',
                                          'per_page': per_page,
-                                         'page': page
+                                         'page': page,
+                                         'sort': 'created',
+                                         'direction': 'desc'
                                      })
 
             # 🔽 에러 처리 부분 25줄 → 3줄로 리팩토링
@@ -179,6 +204,11 @@ class RepoAnalyzer:
 
                 server_create_datetime = datetime.fromisoformat(item['created_at'])
 
+                if cutoff is not None and server_create_datetime <= cutoff:
+                    logger.debug("ℹ️ 캐시에 반영된 시점 이전의 이슈에 도달하여 수집을 중단합니다.")
+                    reached_cached = True
+                    break
+
                 if self.semester_start_date:
                     created_date = server_create_datetime.astimezone(ZoneInfo("Asia/Seoul")).date()
                     week_index = (created_date - self.semester_start_date).days // 7 + 1
@@ -190,16 +220,9 @@ class RepoAnalyzer:
                 self.__previous_create_at = server_create_datetime if self.__previous_create_at is None else max(self.__previous_create_at,server_create_datetime)
 
                 author = item.get('user', {}).get('login', 'Unknown')
-                if author not in self.participants:
-                    self.participants[author] = {
-                        'p_enhancement': 0,
-                        'p_bug': 0,
-                        'p_documentation': 0,
-                        'p_typo': 0,
-                        'i_enhancement': 0,
-                        'i_bug': 0,
-                        'i_documentation': 0,
-                    }
+                counts = self.participants.get(author)
+                if counts is None:
+                    counts = self.participants[author] = _EMPTY_COUNTS.copy()
 
                 labels = item.get('labels', [])
                 label_names = [label.get('name', '') for label in labels if label.get('name')]
@@ -240,11 +263,11 @@ class RepoAnalyzer:
                         if label_names:
                             first_label = label_names[0]
                             if first_label in ['enhancement', 'bug']:
-                                self.participants[author]['p_enhancement'] += 1
+                                counts['p_enhancement'] += 1
                             elif first_label == 'documentation':
-                                self.participants[author]['p_documentation'] += 1
+                                counts['p_documentation'] += 1
                             elif first_label == 'typo':
-                                self.participants[author]['p_typo'] += 1
+                                counts['p_typo'] += 1
 
                 # 이슈 처리 (open / reopened / completed 만 포함, not planned 제외)
                 else:
@@ -253,9 +276,12 @@ class RepoAnalyzer:
                         if label_names:  # 라벨이 존재하는 경우만
                             first_label = label_names[0]  # 첫 번째 라벨만 선택
                             if first_label in ['enhancement', 'bug']:
-                                self.participants[author]['i_enhancement'] += 1
+                                counts['i_enhancement'] += 1
                             elif first_label == 'documentation':
-                                self.participants[author]['i_documentation'] += 1
+                                counts['i_documentation'] += 1
+
+            if reached_cached:
+                break
 
             # 다음 페이지 검사
             link_header = response.headers.get('link', '')
@@ -331,22 +357,15 @@ class RepoAnalyzer:
 
     def _finalize_scores(self, scores: dict, total_score_sum: float, user_info: dict | None = None) -> dict[str, dict[str, float]]:
         """최종 점수 계산 및 정렬"""
-        # 비율 계산
-        for participant in scores:
-            total = scores[participant]["total"]
-            rate = (total / total_score_sum) * 100 if total_score_sum > 0 else 0
-            scores[participant]["rate"] = round(rate, 1)
-
-        # 사용자 정보 매핑 (제공된 경우)
-        if user_info:
-            new_scores = {}
-            for k in list(scores.keys()):
-                display_name = user_info.get(k, k)
-                new_scores[display_name] = scores[k]
-            scores = new_scores
-
-
-        sorted_items = sorted(scores.items(), key=lambda x: x[1]["total"], reverse=True)
+        # 비율 계산과 사용자 정보 매핑을 한 번의 패스로 처리
+        finalized = {}
+        for participant, data in scores.items():
+            rate = (data["total"] / total_score_sum) * 100 if total_score_sum > 0 else 0
+            data["rate"] = round(rate, 1)
+            display_name = user_info.get(participant, participant) if user_info else participant
+            finalized[display_name] = data
+
+        sorted_items = sorted(finalized.items(), key=lambda x: x[1]["total"], reverse=True)
 
         # 공동 등수 처리
         ranked_scores = {}
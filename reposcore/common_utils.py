@@ -1,12 +1,8 @@
+# 끝자리별 영어 서수 접미사 테이블 (11~13만 예외적으로 th)
+_ORDINAL_SUFFIXES = ('th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th')
+
+
 # 등수를 영어 서수로 변환하는 함수
 def get_ordinal_suffix(rank):
-    if 11 <= rank <= 13:
-        return f"{rank}th"
-    elif rank == 1 or (rank >= 21 and rank % 10 == 1):
-        return f"{rank}st"
-    elif rank == 2 or (rank >= 22 and rank % 10 == 2):
-        return f"{rank}nd"
-    elif rank == 3 or (rank >= 23 and rank % 10 == 3):
-        return f"{rank}rd"
-    else:
-        return f"{rank}th"
\ No newline at end of file
+    r100 = rank % 100
+    return f"{rank}{'th' if 11 <= r100 <= 13 else _ORDINAL_SUFFIXES[rank % 10]}"
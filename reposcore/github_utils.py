@@ -1,35 +1,88 @@
+import enum
+import functools
+import json
 import logging
 import os
 import re
 import sys
+import threading
+import time
 
 import requests
 
-from .retry_decorator import retry, retry_request  # retry_request import
+from .retry_decorator import build_session, log_session_stats, retry
 
 logger = logging.getLogger(__name__)
 
-def validate_repo_format(repo: str) -> bool:
-    pattern = r'^[\w\-]+/[\w\-]+$'
-    if re.fullmatch(pattern, repo):
-        return True
-    else:
-        print("저장소 형식이 올바르지 않습니다. 'owner/repo' 형식으로 입력해주세요.")
-        return False
+# 모듈 전체가 공유하는 커넥션 풀 세션. 토큰은 호출 시점의 환경변수를 반영해야
+# 하므로 세션 기본 헤더가 아니라 각 함수에서 요청별 headers로 전달한다.
+_SESSION = build_session()
 
-def validate_token() -> None:
-    """환경변수에서 GitHub 토큰을 읽어서 검증"""
-    token = os.getenv('GITHUB_TOKEN')
+def close_session() -> None:
+    """공유 세션을 닫고 새로 만든다 (테스트 격리용)"""
+    global _SESSION
+    _SESSION.close()
+    _SESSION = build_session()
+
+def _api_headers() -> dict[str, str]:
+    """GitHub API 공통 요청 헤더 생성 (호출 시점의 환경변수 토큰 반영)
+
+    토큰이 있으면 Bearer 인증으로 요청 한도가 시간당 60회에서 5000회로 늘어난다.
+    """
     headers = {
         "Accept": "application/vnd.github+json",
-        "User-Agent": "reposcore-py"
+        "User-Agent": "reposcore-py",
+        "X-GitHub-Api-Version": "2022-11-28",
     }
+    token = os.getenv('GITHUB_TOKEN')
     if token:
-        headers["Authorization"] = f"token {token}"
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+# 저장소 API URL 접두사. 이어붙이는 repo는 validate_repo_format을 통과한
+# 이름이어야 하므로 별도 URL 인코딩은 필요 없다.
+_API_REPOS_PREFIX = "https://api.github.com/repos/"
+
+# (연결, 읽기) 타임아웃 기본값. 연결 3.05초는 TCP SYN 재전송 주기 3초 + 여유분
+_DEFAULT_TIMEOUT = (3.05, 10)
+
+# owner/저장소 이름에 허용되는 문자 집합 (GitHub 이름 규칙: 영문/숫자/밑줄/하이픈)
+_ALLOWED_CHARS = frozenset(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_-"
+)
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_repo_format(repo: str) -> bool:
+    # 짧은 문자열에는 정규식 엔진보다 partition + 집합 검사 한 번이 저렴하다
+    owner, sep, name = repo.partition('/')
+    return bool(sep and owner and name and '/' not in name
+                and _ALLOWED_CHARS.issuperset(owner)
+                and _ALLOWED_CHARS.issuperset(name))
+
+def validate_repo_format(repo: str) -> bool:
+    # 검사는 캐시된 순수 함수가 담당하고, 경고 출력은 캐시 밖에서 매번 수행한다
+    # (같은 잘못된 입력이 반복돼도 경고가 생략되지 않도록)
+    if _is_valid_repo_format(repo):
+        return True
+    logger.warning("저장소 형식이 올바르지 않습니다. 'owner/repo' 형식으로 입력해주세요.")
+    return False
+
+# _ALLOWED_CHARS와 같은 규칙의 멀티라인 앵커 패턴 (\w은 re.ASCII로 영숫자+밑줄)
+_BATCH_REPO_RE = re.compile(r'(?m)^[\w\-]+/[\w\-]+$', re.ASCII)
 
-    session = requests.Session()
+def validate_repo_formats(repos: list[str]) -> dict[str, bool]:
+    """여러 저장소명의 형식을 한 번에 검증하는 함수 (입력 순서 유지)
+
+    항목마다 파이썬 수준 검사를 반복하는 대신 개행으로 이어붙인 문자열을
+    정규식 엔진이 한 번에 훑게 해 호출 경계 비용을 N개 입력에 분산한다.
+    """
+    valid = set(_BATCH_REPO_RE.findall('\n'.join(repos)))
+    return {repo: repo in valid for repo in repos}
+
+def validate_token() -> None:
+    """환경변수에서 GitHub 토큰을 읽어서 검증"""
     try:
-        response = retry_request(session, "https://api.github.com/user", headers=headers)
+        response = retry_request(_SESSION, "https://api.github.com/user", headers=_api_headers())
     except Exception as e:
         logger.error(f"❌ 인증 API 요청 자체가 실패했습니다: {e}")
         sys.exit(1)
@@ -37,49 +90,145 @@ def validate_token() -> None:
         logger.error('❌ 인증 실패: 잘못된 GitHub 토큰입니다. 토큰 값을 확인해 주세요.')
         sys.exit(1)
 
-def check_github_repo_exists(repo: str) -> bool:
-    """GitHub 저장소 존재 여부를 확인하는 함수 (환경변수에서 토큰 자동 읽기)"""
-    token = os.getenv('GITHUB_TOKEN')
-    url = f"https://api.github.com/repos/{repo}"
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "User-Agent": "reposcore-py"
-    }
-    if token:
-        headers["Authorization"] = f"token {token}"
+class RepoStatus(enum.Enum):
+    """저장소 존재 확인 결과
+
+    '없음'(404)과 일시적 실패(한도 초과/인증/네트워크)를 구분해, 재시도 여부를
+    판단하려는 호출자가 같은 요청을 다시 보내지 않아도 되게 한다.
+    """
+    EXISTS = "exists"
+    NOT_FOUND = "not_found"
+    UNAUTHORIZED = "unauthorized"
+    RATE_LIMITED = "rate_limited"
+    NETWORK_ERROR = "network_error"
+
+# 존재 확인 결과 TTL 캐시 (저장소명 → (기록 시각, 결과)); 한 실행 내 중복 호출 제거용
+_EXISTS_CACHE: dict[str, tuple[float, RepoStatus]] = {}
+_EXISTS_CACHE_TTL = 3600.0
+
+# 실행 간 공유하는 디스크 캐시 (저장소명 → {'etag', 'exists'}).
+# ETag를 If-None-Match로 보내면 304 응답은 기본 요청 한도를 소모하지 않는다.
+_DISK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "reposcore", "repo_exists.json")
+_disk_cache: dict[str, dict] | None = None
+# 병렬 존재 확인 스레드들이 캐시 딕셔너리 수정과 json.dump를 동시에 수행하면
+# 순회 중 크기 변경으로 깨질 수 있어 적재/수정/저장을 하나의 락으로 보호한다
+# (수정 구간 안에서 적재 함수를 다시 부를 수 있으므로 재진입 가능 락 사용)
+_DISK_CACHE_LOCK = threading.RLock()
+
+def _load_disk_cache() -> dict[str, dict]:
+    global _disk_cache
+    if _disk_cache is None:
+        with _DISK_CACHE_LOCK:
+            if _disk_cache is None:
+                try:
+                    with open(_DISK_CACHE_PATH, "r", encoding="utf-8") as f:
+                        _disk_cache = json.load(f)
+                except (OSError, ValueError):
+                    _disk_cache = {}
+    return _disk_cache
 
-    session = requests.Session()
+def _save_disk_cache() -> None:
     try:
-        response = retry_request(session, url, headers=headers)
+        os.makedirs(os.path.dirname(_DISK_CACHE_PATH), exist_ok=True)
+        with open(_DISK_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(_disk_cache, f)
+    except OSError:
+        pass  # 디스크 캐시 저장 실패는 치명적이지 않으므로 무시
+
+@retry(max_retries=3, retry_delay=0.5, max_delay=60.0)
+def _head_with_retry(url: str, headers: dict[str, str]) -> requests.Response:
+    """HEAD 요청을 보내되 일시적 오류(5xx/429)는 예외로 바꿔 재시도
+
+    Retry-After를 동반한 403(2차 요청 한도)도 대기 후 재시도 대상이다.
+    404는 '저장소 없음'이라는 확정 응답이므로 재시도하지 않는다.
+    대기 시간은 retry 데코레이터가 서버 지시(Retry-After/X-RateLimit-Reset)
+    우선, 없으면 백오프+지터로 정하며 60초로 상한을 둔다.
+    """
+    # retry_request를 거치면 데코레이터가 중첩돼 재시도 횟수가 곱으로 늘어나므로
+    # 세션에 직접 요청한다 (재시도는 이 함수의 @retry 한 겹이 전담)
+    response = _SESSION.request('HEAD', url, headers=headers, timeout=_DEFAULT_TIMEOUT)
+    if (response.status_code == 429 or response.status_code >= 500
+            or (response.status_code == 403 and 'Retry-After' in response.headers)):
+        response.raise_for_status()
+    return response
+
+def check_github_repo_status(repo: str, use_cache: bool = True) -> RepoStatus:
+    """GitHub 저장소 존재 여부를 확인하는 함수 (환경변수에서 토큰 자동 읽기)
+
+    확정 결과(EXISTS/NOT_FOUND)만 캐시하고, 일시적 실패는 캐시하지 않는다.
+    """
+    cached = _EXISTS_CACHE.get(repo) if use_cache else None
+    if cached is not None and time.monotonic() - cached[0] < _EXISTS_CACHE_TTL:
+        return cached[1]
+
+    url = _API_REPOS_PREFIX + repo
+    headers = _api_headers()
+
+    disk_entry = _load_disk_cache().get(repo) if use_cache else None
+    if disk_entry and disk_entry.get('etag'):
+        headers["If-None-Match"] = disk_entry['etag']
+
+    try:
+        # 상태 코드만 필요하므로 HEAD로 요청해 본문 전송/파싱 비용을 없앤다
+        response = _head_with_retry(url, headers)
     except Exception as e:
         logger.warning(f"⚠️ 저장소 존재 확인 API 요청 자체가 실패했습니다: {e}")
-        return False
+        return RepoStatus.NETWORK_ERROR
+
+    if response.status_code == 304:
+        # 변경 없음: 디스크 캐시 결과를 그대로 사용 (요청 한도 미소모)
+        status = RepoStatus.EXISTS if disk_entry['exists'] else RepoStatus.NOT_FOUND
+        _EXISTS_CACHE[repo] = (time.monotonic(), status)
+        return status
 
     if response.status_code == 200:
-        return True
-    elif response.status_code == 403:
-        logger.warning("⚠️ GitHub API 요청 실패: 403 (요청 횟수 초과 또는 인증 오류)")
+        status = RepoStatus.EXISTS
+    elif response.status_code == 401:
+        logger.warning("⚠️ GitHub API 요청 실패: 401 (잘못된 토큰)")
+        return RepoStatus.UNAUTHORIZED
+    elif response.status_code in (403, 429):
+        logger.warning(f"⚠️ GitHub API 요청 실패: {response.status_code} (요청 횟수 초과 또는 인증 오류)")
         logger.info("ℹ️ 해결 방법: --token 옵션 또는 GITHUB_TOKEN 환경 변수 사용")
+        return RepoStatus.RATE_LIMITED
     elif response.status_code == 404:
         logger.warning(f"⚠️ 저장소 '{repo}'가 존재하지 않습니다.")
+        status = RepoStatus.NOT_FOUND
     else:
         logger.warning(f"⚠️ 요청 실패: HTTP 상태 코드 {response.status_code}")
+        return RepoStatus.NETWORK_ERROR
 
-    return False
+    if use_cache:
+        _EXISTS_CACHE[repo] = (time.monotonic(), status)
+        etag = response.headers.get('ETag')
+        if etag:
+            with _DISK_CACHE_LOCK:
+                _load_disk_cache()[repo] = {'etag': etag, 'exists': status is RepoStatus.EXISTS}
+                _save_disk_cache()
+    return status
+
+def check_github_repo_exists(repo: str, use_cache: bool = True) -> bool:
+    """check_github_repo_status의 bool 버전 (하위 호환용)"""
+    return check_github_repo_status(repo, use_cache) is RepoStatus.EXISTS
+
+def check_github_repos_exist(repos: list[str]) -> dict[str, bool]:
+    """여러 저장소의 존재 여부를 병렬로 확인하는 함수 (입력 순서 유지)
+
+    공유 세션의 커넥션 풀을 스레드들이 나눠 쓰므로 N개 확인이 순차 왕복의
+    합이 아니라 가장 느린 응답 시간 수준으로 끝난다.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not repos:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(repos))) as executor:
+        results = dict(zip(repos, executor.map(check_github_repo_exists, repos)))
+    log_session_stats(_SESSION)  # DEBUG 레벨에서만 풀 사용 집계 출력
+    return results
 
 def check_rate_limit() -> None:
     """현재 GitHub API 요청 가능 횟수와 전체 한도를 확인하고 출력하는 함수 (환경변수에서 토큰 자동 읽기)"""
-    token = os.getenv('GITHUB_TOKEN')
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "User-Agent": "reposcore-py"
-    }
-    if token:
-        headers["Authorization"] = f"token {token}"
-
-    session = requests.Session()
     try:
-        response = retry_request(session, "https://api.github.com/rate_limit", headers=headers)
+        response = retry_request(_SESSION, "https://api.github.com/rate_limit", headers=_api_headers())
     except Exception as e:
         logger.error(f"API 요청 제한 정보를 가져오는데 실패했습니다: {e}")
         return
@@ -97,12 +246,17 @@ def retry_request(
     session: requests.Session,
     url: str,
     params: dict[str, str] | None = None,
-    headers: dict[str, str] | None = None
+    headers: dict[str, str] | None = None,
+    method: str = 'GET',
+    timeout: tuple[float, float] = _DEFAULT_TIMEOUT
 ) -> requests.Response:
     """
     단순히 한 번만 요청을 보내고,
     네트워크 오류 시 retry_decorator가 재시도 처리합니다.
-    
+
+    timeout 기본값은 (연결, 읽기) 초 단위 제한으로, 멈춘 연결이
+    무한정 대기하는 대신 Timeout 예외로 빠르게 실패해 재시도 경로를 탄다.
+
     Note: 이 함수는 이미 세션에 토큰이 설정되어 있다고 가정합니다.
     """
-    return session.get(url, params=params, headers=headers)
\ No newline at end of file
+    return session.request(method, url, params=params, headers=headers, timeout=timeout)
\ No newline at end of file
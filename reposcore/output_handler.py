@@ -1,20 +1,61 @@
 #!/usr/bin/env python3
+import functools
 import logging
 logging.getLogger('matplotlib').setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
 
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
 from datetime import datetime, date
 from zoneinfo import ZoneInfo
-from prettytable import PrettyTable
-
 
+from .common_utils import get_ordinal_suffix
 from .theme_manager import ThemeManager
 
 import os
 
+# ZoneInfo는 호출마다 tzdata를 파싱하므로 모듈 수준에서 한 번만 만든다
+_KST = ZoneInfo("Asia/Seoul")
+
+# matplotlib/pandas/numpy/prettytable은 임포트 비용이 커서(수백 ms, 수십 MB)
+# 실제로 사용하는 메서드 안에서 지연 임포트한다. 텍스트/CSV만 뽑는 실행은
+# matplotlib을 전혀 로드하지 않는다.
+
+
+@functools.lru_cache(maxsize=1)
+def _get_report_template():
+    """HTML 보고서 Jinja2 템플릿을 한 번만 컴파일해 재사용"""
+    import jinja2
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(__file__), 'templates')),
+        autoescape=True,
+    )
+    return env.get_template('report.html.j2')
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_korean_font() -> str | None:
+    """한글 폰트를 matplotlib에 등록하고 rcParams를 설정 (프로세스당 한 번만 수행)
+
+    Linux 환경에서 CJK 폰트 수동 설정.
+    OSS 한글 폰트인 나눔고딕, 본고딕, 백묵 중 순서대로 하나를 선택한다.
+    """
+    import matplotlib.font_manager as fm
+    import matplotlib.pyplot as plt
+
+    font_paths = [
+        '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',  # 나눔고딕
+        '/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc',  # 본고딕
+        '/usr/share/fonts/truetype/baekmuk/baekmuk.ttf'  # 백묵
+    ]
+    for font_path in font_paths:
+        if os.path.exists(font_path):
+            fm.fontManager.addfont(font_path)
+            plt.rcParams['font.family'] = 'sans-serif'
+            plt.rcParams['font.sans-serif'] = ['NanumGothic', 'Noto Sans CJK JP', 'Baekmuk']
+            plt.rcParams['axes.unicode_minus'] = False
+            return font_path
+    return None
+
+
 class OutputHandler:
     """Class to handle output generation for repository analysis results"""
     
@@ -25,203 +66,273 @@ class OutputHandler:
         'bar_height': 0.5,             # 막대 높이
         'figure_width': 12,            # 차트 너비 (텍스트 잘림 방지 위해 증가)
         'font_size': 9,                # 폰트 크기
-        'text_padding': 0.1            # 텍스트 배경 상자 패딩
+        'text_padding': 0.1,           # 텍스트 배경 상자 패딩
+        'dpi': 150                     # 차트 저장 해상도
     }
 
+    # 점수 딕셔너리의 PR/이슈 세부 항목 열 (DataFrame 합산에 사용)
+    _PR_COLS = ['feat/bug PR', 'document PR', 'typo PR']
+    _ISSUE_COLS = ['feat/bug issue', 'document issue']
+
+    @classmethod
+    def _scores_to_df(cls, scores: dict) -> "pd.DataFrame":
+        """점수 딕셔너리를 참여자 인덱스 DataFrame으로 변환 (등급 열 포함)"""
+        import pandas as pd
+        df = pd.DataFrame.from_dict(scores, orient='index')
+        if 'total' in df.columns:
+            # 등급은 변환 시점에 전체를 벡터로 한 번만 계산해 둔다
+            df['grade'] = cls._grades_vec(df['total'].to_numpy())
+        return df
+
+    # 등급 경계 (0~49: F, 50대: E, 60대: D, 70대: C, 80대: B, 90 이상: A)
+    _GRADE_THRESHOLDS = (50, 60, 70, 80, 90)
+    _GRADE_LABELS = ('F', 'E', 'D', 'C', 'B', 'A')
+
+    @classmethod
+    def _grades_vec(cls, totals) -> "np.ndarray":
+        """총점 배열 전체의 등급을 이진 탐색 한 번으로 계산"""
+        import numpy as np
+        labels = np.array(cls._GRADE_LABELS)
+        return labels[np.searchsorted(cls._GRADE_THRESHOLDS, totals, side='right')]
+
     def __init__(self, theme: str = 'default', dry_run: bool = False):
         self.theme_manager = ThemeManager()  # 테마 매니저 초기화
         self.set_theme(theme)                # 테마 설정
-        self.dry_run = dry_run              
+        self.dry_run = dry_run
+        # 차트 간 재사용하는 Figure/Axes (생성 비용이 커서 한 번만 만든다)
+        self._fig = None
+        self._ax = None
+        # 보고서 묶음이 공유하는 분석 기준 시각 (첫 사용 시 계산)
+        self._report_ts = None
+
+    def _get_axes(self, width: float, height: float):
+        """재사용 Figure의 크기를 맞추고 비워진 Axes를 돌려준다"""
+        import matplotlib.pyplot as plt
+        if self._fig is None:
+            self._fig, self._ax = plt.subplots(figsize=(width, height))
+        else:
+            self._ax.clear()
+            self._fig.set_size_inches(width, height)
+            # 이전 차트가 바꾼 배경색(다크 테마 등)이 다음 차트에 남지 않도록 기본값으로 복원
+            self._fig.patch.set_facecolor(plt.rcParams['figure.facecolor'])
+        return self._fig, self._ax
+
+    def close_figures(self) -> None:
+        """재사용하던 Figure를 해제한다 (모든 차트 생성이 끝난 뒤 호출)"""
+        if self._fig is not None:
+            import matplotlib.pyplot as plt
+            plt.close(self._fig)
+            self._fig = None
+            self._ax = None
 
     def set_theme(self, theme_name: str) -> None:
         if theme_name in self.theme_manager.themes:
             self.theme_manager.current_theme = theme_name
+            # 제목/요약 텍스트 색은 테마 결정 시점에 한 번만 계산해 둔다
+            chart_style = self.theme_manager.themes[theme_name].get("chart", {}).get("style", {})
+            self._title_color = chart_style.get("text", "#212529")
         else:
             raise ValueError(f"지원하지 않는 테마입니다: {theme_name}")
             
     def _summarize_scores(self, scores: dict[str, dict[str, float]]) -> tuple[float, float, float]:
         """점수 딕셔너리에서 평균, 최고점, 최저점을 계산해서 반환"""
-        total_scores = [score["total"] for score in scores.values()]
-        
-        if not total_scores:
+        import numpy as np
+
+        if not scores:
             return 0.0, 0.0, 0.0  # 점수가 없는 경우 방어 처리
 
-        avg_score = sum(total_scores) / len(total_scores)
-        max_score = max(total_scores)
-        min_score = min(total_scores)
+        # 총점만 ndarray로 모아 C 수준 축소 연산으로 통계를 계산
+        totals = np.fromiter(
+            (score["total"] for score in scores.values()), dtype=float, count=len(scores)
+        )
+        return float(totals.mean()), float(totals.max()), float(totals.min())
 
-        return avg_score, max_score, min_score
 
+    @staticmethod
+    def _render_table(header: list[str], rows: list[list[str]]) -> str:
+        """열 너비를 한 번만 계산해 고정폭 텍스트 표를 만든다 (PrettyTable 대체)"""
+        widths = [
+            max(len(header[i]), max((len(row[i]) for row in rows), default=0))
+            for i in range(len(header))
+        ]
+        border = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+        lines = [border,
+                 "| " + " | ".join(h.center(w) for h, w in zip(header, widths)) + " |",
+                 border]
+        for row in rows:
+            lines.append("| " + " | ".join(c.rjust(w) for c, w in zip(row, widths)) + " |")
+        lines.append(border)
+        return "\n".join(lines)
 
     @staticmethod
     def get_kst_timestamp() -> str:
         """현재 KST(한국 시간) 기준 타임스탬프 반환"""
-        kst = ZoneInfo("Asia/Seoul")
-        return datetime.now(tz=kst).strftime("%Y-%m-%d %H:%M:%S (KST)")
+        return datetime.now(tz=_KST).strftime("%Y-%m-%d %H:%M:%S (KST)")
+
+    def _report_timestamp(self) -> str:
+        """같은 핸들러가 만드는 보고서들은 동일한 분석 기준 시각을 공유"""
+        if self._report_ts is None:
+            self._report_ts = self.get_kst_timestamp()
+        return self._report_ts
 
     def generate_table(self, scores: dict[str, dict[str, float]], save_path) -> None:
-        """결과를 테이블 형태로 출력"""
+        """결과를 테이블 형태로 출력 (scores는 순위순 정렬 전제)"""
         if self.dry_run:
             print(f"[DRY-RUN] 테이블 저장 생략 (예상 경로: {save_path})")
             return
-        timestamp = self.get_kst_timestamp()
-        table = PrettyTable()
-        table.field_names = ["참여자", "총점", "PR(기능/버그)", "PR(문서)", "PR(오타)", "이슈(기능/버그)", "이슈(문서)"]
-        
-        for name, score in scores.items():
-            row = [
+        timestamp = self._report_timestamp()
+        header = ["참여자", "총점", "등급", "PR(기능/버그)", "PR(문서)", "PR(오타)", "이슈(기능/버그)", "이슈(문서)"]
+        # 등급은 전체 총점에 대해 한 번에 벡터로 계산
+        grades = self._grades_vec([score['total'] for score in scores.values()])
+        rows = []
+        for (name, score), grade in zip(scores.items(), grades):
+            total = score['total']
+            rows.append([
                 name,
-                f"{score['total']:.1f}",
+                f"{total:.1f}",
+                grade,
                 f"{score['feat/bug PR']:.1f}",
                 f"{score['document PR']:.1f}",
                 f"{score['typo PR']:.1f}",
                 f"{score['feat/bug issue']:.1f}",
-                f"{score['document issue']:.1f}"
-            ]
-            table.add_row(row)
+                f"{score['document issue']:.1f}",
+            ])
 
         # 평균, 최고점, 최저점
         avg_score, max_score, min_score = self._summarize_scores(scores)
-        
+
+        dir_path = os.path.dirname(save_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        # 문자열을 모아 한 번의 write로 저장 (쓰기 횟수 최소화)
+        parts = [
+            f"=== 참여자별 점수 (분석 기준 시각: {timestamp}) ===\n\n",
+            "[요약 통계]\n",
+            f"- 평균 점수: {avg_score:.1f}\n",
+            f"- 최고 점수: {max_score:.1f}\n",
+            f"- 최저 점수: {min_score:.1f}\n\n",
+            self._render_table(header, rows),
+        ]
         with open(save_path, 'w', encoding='utf-8') as f:
-            f.write(f"=== 참여자별 점수 (분석 기준 시각: {timestamp}) ===\n\n")
-            f.write("[요약 통계]\n")
-            f.write(f"- 평균 점수: {avg_score:.1f}\n")
-            f.write(f"- 최고 점수: {max_score:.1f}\n")
-            f.write(f"- 최저 점수: {min_score:.1f}\n\n")
-            f.write(str(table))
+            f.write("".join(parts))
 
     def generate_count_csv(self, scores: dict, save_path: str = None) -> None:
         """결과를 CSV 파일로 출력"""
-        timestamp = self.get_kst_timestamp()
-        df = pd.DataFrame.from_dict(scores, orient='index')
+        if self.dry_run:
+            print(f"[DRY-RUN] CSV 저장 생략 (예상 경로: {save_path})")
+            return
+        df = self._scores_to_df(scores)
+        if 'grade' in df.columns:
+            df = df.drop(columns=['grade'])  # CSV는 기존 열 구성을 유지
         if 'rank' in df.columns:
             df.insert(0, 'rank', df.pop('rank'))
             df = df.sort_values('rank')
         df = df.round(1)
         df.index.name = 'name'  # 인덱스 이름을 'name'으로 설정
-        df.to_csv(save_path, encoding='utf-8')
+        # 플랫폼별 개행 차이(\r\n)를 막기 위해 개행 문자를 고정
+        df.to_csv(save_path, encoding='utf-8', lineterminator='\n')
 
 
     def generate_text(self, scores: dict[str, dict[str, float]], save_path: str) -> None:
-        """PrettyTable을 사용해 참여자 점수를 표 형식으로 출력"""
-        timestamp = self.get_kst_timestamp()
-
-        sorted_scores = dict(sorted(scores.items(), key=lambda x: x[1].get('rank', 0)))
+        """참여자 점수를 고정폭 텍스트 표로 출력 (scores는 순위순 정렬 전제)"""
+        if self.dry_run:
+            print(f"[DRY-RUN] 텍스트 저장 생략 (예상 경로: {save_path})")
+            return
+        timestamp = self._report_timestamp()
 
-        table = PrettyTable()
-        table.field_names = [
-            "Rank","Name", "Total Score",
+        header = [
+            "Rank", "Name", "Total Score", "Grade",
             "PR (Feature/Bug)", "PR (Docs)", "PR (Typos)",
             "Issue (Feature/Bug)", "Issue (Docs)"
         ]
 
-        for rank, (name, score) in enumerate(scores.items(), start=1):
-            table.add_row([
-                int(score['rank']),
+        # 등급은 전체 총점에 대해 한 번에 벡터로 계산
+        grades = self._grades_vec([score['total'] for score in scores.values()])
+        rows = []
+        for (name, score), grade in zip(scores.items(), grades):
+            rows.append([
+                str(int(score['rank'])),
                 name,
-                int(score['total']),
-                int(score['feat/bug PR']),
-                int(score['document PR']),
-                int(score['typo PR']),
-                int(score['feat/bug issue']),
-                int(score['document issue']),
+                str(int(score['total'])),
+                grade,
+                str(int(score['feat/bug PR'])),
+                str(int(score['document PR'])),
+                str(int(score['typo PR'])),
+                str(int(score['feat/bug issue'])),
+                str(int(score['document issue'])),
             ])
-        
+
         # 평균, 최고점, 최저점
         avg_score, max_score, min_score = self._summarize_scores(scores)
 
+        dir_path = os.path.dirname(save_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        # 문자열을 모아 한 번의 write로 저장 (쓰기 횟수 최소화)
+        parts = [
+            f"=== 참여자별 점수 (분석 기준 시각: {timestamp}) ===\n\n",
+            "[요약 통계]\n",
+            f"- 평균 점수: {avg_score:.1f}\n",
+            f"- 최고 점수: {max_score:.1f}\n",
+            f"- 최저 점수: {min_score:.1f}\n\n",
+            self._render_table(header, rows),
+        ]
         with open(save_path, 'w', encoding='utf-8') as f:
-            f.write(f"=== 참여자별 점수 (분석 기준 시각: {timestamp}) ===\n\n")
-            f.write("[요약 통계]\n")
-            f.write(f"- 평균 점수: {avg_score:.1f}\n")
-            f.write(f"- 최고 점수: {max_score:.1f}\n")
-            f.write(f"- 최저 점수: {min_score:.1f}\n\n")
-            f.write(table.get_string())
+            f.write("".join(parts))
 
 
     def _calculate_activity_ratios(self, participant_scores: dict) -> tuple[float, float, float]:
-        """활동 비율 계산"""
-        total_pr = sum(score['feat/bug PR'] + score['document PR'] + score['typo PR'] for score in participant_scores.values())
-        total_issue = sum(score['feat/bug issue'] + score['document issue'] for score in participant_scores.values())
+        """활동 비율 계산 (점수 딕셔너리를 한 번만 순회)"""
+        tot_fb_pr = tot_doc_pr = tot_typo_pr = tot_fb_issue = tot_doc_issue = 0.0
+        for score in participant_scores.values():
+            tot_fb_pr += score['feat/bug PR']
+            tot_doc_pr += score['document PR']
+            tot_typo_pr += score['typo PR']
+            tot_fb_issue += score['feat/bug issue']
+            tot_doc_issue += score['document issue']
+
+        total_pr = tot_fb_pr + tot_doc_pr + tot_typo_pr
+        total_issue = tot_fb_issue + tot_doc_issue
         total = total_pr + total_issue
 
         if total == 0:
             return 0.0, 0.0, 0.0
 
-        pr_ratio = total_pr / total
-        issue_ratio = total_issue / total
-        code_ratio = (sum(score['feat/bug PR'] for score in participant_scores.values()) + 
-                    sum(score['feat/bug issue'] for score in participant_scores.values())) / total
-
-        return pr_ratio, issue_ratio, code_ratio
+        return total_pr / total, total_issue / total, (tot_fb_pr + tot_fb_issue) / total
 
     def generate_chart(self, scores: dict[str, dict[str, float]], save_path: str) -> None:
         """결과를 차트로 출력: PR과 이슈를 단일 스택형 막대 그래프로 통합"""
+        if self.dry_run:
+            print(f"[DRY-RUN] 차트 저장 생략 (예상 경로: {save_path})")
+            return
+        if not scores:
+            # 빈 데이터면 matplotlib 로드/렌더링 비용을 아예 치르지 않는다
+            logger.warning("차트로 그릴 점수 데이터가 없어 생성을 건너뜁니다.")
+            return
+        import numpy as np
 
         theme_colors = self.theme_manager.themes[self.theme_manager.current_theme]
         chart_style = theme_colors.get("chart", {}).get("style", {})
-        pr_color = chart_style.get("primary", "#4e79a7")
-        issue_color = chart_style.get("secondary", "#f28e2c")
         text_color = chart_style.get("text", "#212529")
         bg_color = chart_style.get("background", "#ffffff")
         grid_color = chart_style.get("grid", "#e9ecef")
+        # 테마에서 막대 색상 가져오기 (기본값 유지)
+        pr_color = theme_colors.get("pr_color", "skyblue")  # 기본: skyblue
+        issue_color = theme_colors.get("issue_color", "lightgreen")  # 기본: lightgreen
 
-        # Linux 환경에서 CJK 폰트 수동 설정
-        # OSS 한글 폰트인 본고딕, 나눔고딕, 백묵 중 순서대로 하나를 선택
-        font_paths = [
-            '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',  # 나눔고딕
-            '/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc',  # 본고딕
-            '/usr/share/fonts/truetype/baekmuk/baekmuk.ttf'  # 백묵
-        ]
-
-        sorted_items = sorted(scores.items(), key=lambda x: x[1].get("rank", 0))
-        sorted_scores = dict(sorted_items)
-
-        # 등수를 영어 서수로 변환하는 함수
-        def get_ordinal_suffix(rank: int) -> str:
-            if rank == 1:
-                return "1st"
-            elif rank == 2:
-                return "2nd"
-            elif rank == 3:
-                return "3rd"
-            else:
-                return f"{rank}th"
-
-        participants = list(sorted_scores.keys())
-        pr_scores = [sorted_scores[p]['feat/bug PR'] + sorted_scores[p]['document PR'] + sorted_scores[p]['typo PR'] for p in participants]
-        issue_scores = [sorted_scores[p]['feat/bug issue'] + sorted_scores[p]['document issue'] for p in participants]
-        total_scores = [sorted_scores[p]['total'] for p in participants]
-        
-        ranked_participants = [f"{user} ({get_ordinal_suffix(int(sorted_scores[user].get("rank", 0)))})" for user in participants]
-
-        timestamp = self.get_kst_timestamp()
-
-        # 정렬된 참여자 리스트 만들기
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1]["total"], reverse=True)
-        participants = [user for user, _ in sorted_scores]
-        total_scores = [score_data["total"] for _, score_data in sorted_scores]
-        pr_scores = [score_data["feat/bug PR"] + score_data["document PR"] + score_data["typo PR"] for _, score_data in sorted_scores]
-        issue_scores = [score_data["feat/bug issue"] + score_data["document issue"] for _, score_data in sorted_scores]
-
-        # 등수 붙이기
-        ranked_participants = [f"{user} ({get_ordinal_suffix(int(scores[user].get('rank', 0)))})" for user in participants]
+        _resolve_korean_font()
 
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                fm.fontManager.addfont(font_path)
-                plt.rcParams['font.family'] = 'sans-serif'
-                plt.rcParams['font.sans-serif'] = ['NanumGothic', 'Noto Sans CJK JP', 'Baekmuk']
-                break
+        timestamp = self._report_timestamp()
 
         # 참여자 수에 따라 차트 높이 조정
         num_participants = len(scores)
         chart_height = max(self.CHART_CONFIG['min_height'], 
                          num_participants * self.CHART_CONFIG['height_per_participant'])
 
-        # 차트 생성
-        fig, ax = plt.subplots(figsize=(self.CHART_CONFIG['figure_width'], chart_height))
+        # 차트 생성 (Figure는 호출 간 재사용)
+        fig, ax = self._get_axes(self.CHART_CONFIG['figure_width'], chart_height)
 
         fig.patch.set_facecolor(bg_color)        
         ax.set_facecolor(bg_color)               
@@ -234,48 +345,45 @@ class OutputHandler:
         ax.spines['left'].set_color(grid_color)
         ax.spines['right'].set_color(grid_color)
         
-        # 데이터 준비
-        participants = list(scores.keys())
-        pr_scores = [scores[p]['feat/bug PR'] + scores[p]['document PR'] + scores[p]['typo PR'] for p in participants]
-        issue_scores = [scores[p]['feat/bug issue'] + scores[p]['document issue'] for p in participants]
-        total_scores = [scores[p]['total'] for p in participants]
+        # 데이터 준비 (참여자별 합산은 DataFrame에서 C 수준 축소 연산으로 한 번에 계산)
+        df = self._scores_to_df(scores)
+        participants = list(df.index)
+        pr_scores = df[self._PR_COLS].to_numpy().sum(axis=1)
+        issue_scores = df[self._ISSUE_COLS].to_numpy().sum(axis=1)
+        total_scores = df['total'].to_numpy()
+
+        # 등수 붙이기
+        ranked_participants = [f"{user} ({get_ordinal_suffix(int(scores[user].get('rank', 0)))})" for user in participants]
 
         # 막대 위치 설정
         y_pos = range(len(participants))
         bar_height = self.CHART_CONFIG['bar_height']
 
-        # 테마에서 색상 가져오기 (기본값 유지)
-        theme_colors = self.theme_manager.themes[self.theme_manager.current_theme]
-        pr_color = theme_colors.get("pr_color", "skyblue")  # 기본: skyblue
-        issue_color = theme_colors.get("issue_color", "lightgreen")  # 기본: lightgreen
-
         # 단일 스택형 막대 그리기
         ax.barh(y_pos, pr_scores, height=bar_height, label='PR', color=pr_color, edgecolor='none')
         ax.barh(y_pos, issue_scores, left=pr_scores, height=bar_height, label='Issue', color=issue_color, edgecolor='none')
 
-        pr_ratio, issue_ratio, _ = self._calculate_activity_ratios(scores)
-        
-        x_offset = max(total_scores) * 0.02  # 전체 점수의 2%만큼 오른쪽으로
+        # 점수 및 PR/Issue 비율 표시: 라벨 문자열과 위치를 먼저 일괄 계산한 뒤 그리기만 반복
+        totals_arr = np.asarray(total_scores, dtype=float)
+        pr_arr = np.asarray(pr_scores, dtype=float)
+        issue_arr = np.asarray(issue_scores, dtype=float)
+        contrib = np.maximum(pr_arr + issue_arr, 1)
+        pr_pct = (pr_arr / contrib * 100).astype(int)
+        issue_pct = (issue_arr / contrib * 100).astype(int)
 
-        # 점수 및 PR/Issue 비율 표시
-        for i, user in enumerate(participants):
-            total = total_scores[i]
+        x_offset = totals_arr.max() * 0.02  # 전체 점수의 2%만큼 오른쪽으로
+        # 위치 조정 (짧은 막대 보호)
+        text_xs = np.where(totals_arr > 3, totals_arr + x_offset, totals_arr + 2.0)
 
-            pr_score = pr_scores[i]
-            issue_score = issue_scores[i]
-            total_contrib = pr_score + issue_score
-            pr_ratio = pr_score / total_contrib if total_contrib else 0
-            issue_ratio = issue_score / total_contrib if total_contrib else 0
+        # 등급은 _scores_to_df가 미리 계산해 둔 열을 그대로 사용
+        grades = df['grade'].to_numpy()
 
-            # 두 줄로 출력 (줄바꿈)
-            label = f'{total:.1f} \nP:{int(pr_ratio*100)}% I:{int(issue_ratio*100)}%'
+        # 두 줄로 출력 (줄바꿈)
+        labels = [f'{total:.1f} ({grade})\nP:{p}% I:{q}%'
+                  for total, grade, p, q in zip(totals_arr, grades, pr_pct, issue_pct)]
 
-            # 위치 조정 (짧은 막대 보호)
-            x_offset = max(total_scores) * 0.02
-            text_x = total + x_offset if total > 3 else total + 2.0
-
-            # 폰트 크기 조절
-            ax.text(text_x, i, label, va='center', fontsize=8, color=text_color)
+        for i, label in enumerate(labels):
+            ax.text(text_xs[i], i, label, va='center', fontsize=8, color=text_color)
 
         # 평균, 최고점, 최저점
         avg_score, max_score, min_score = self._summarize_scores(scores)
@@ -288,7 +396,7 @@ class OutputHandler:
             f'Repository Contribution Scores\n(Generated at {timestamp})',
             fontsize=14,
             loc='center',  # 또는 'left', 'right'
-            color='black'
+            color=self._title_color
         )
         ax.text(
             1.0,
@@ -298,28 +406,42 @@ class OutputHandler:
             ha='right',
             va='top',
             fontsize=10,
-            color='black'
+            color=self._title_color
         )
-        ax.invert_yaxis()
+        # 1등이 위로 오도록 세로축 범위를 직접 지정 (역순 + 여백 고정)
+        ax.set_ylim(num_participants - 0.5, -0.5)
 
         # 범례 추가 (테두리 없음)
         ax.legend(loc='upper right', frameon=False)
 
         # 가로축 여백 조정 (텍스트 잘림 방지)
-        max_score = max(total_scores) if total_scores else 100
+        max_score = total_scores.max() if total_scores.size else 100
         ax.set_xlim(0, max_score + max_score * self.CHART_CONFIG['text_padding'])
 
         # 여백 조정
-        plt.tight_layout()
+        fig.tight_layout()
 
         # 저장
-        plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor=fig.get_facecolor())
-        plt.close() 
+        dir_path = os.path.dirname(save_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        # 확장자가 .svg면 래스터화 없이 벡터로 저장 (dpi 무의미)
+        if os.path.splitext(save_path)[1].lower() == '.svg':
+            fig.savefig(save_path, facecolor=fig.get_facecolor())
+        else:
+            fig.savefig(save_path, dpi=self.CHART_CONFIG['dpi'], facecolor=fig.get_facecolor())
 
     def generate_repository_stacked_chart(self, scores: dict, save_path: str):
+        if self.dry_run:
+            print(f"[DRY-RUN] 누적 차트 저장 생략 (예상 경로: {save_path})")
+            return
+        import numpy as np
+
         if not scores:
             return
 
+        _resolve_korean_font()
+
         # ✅ 모든 사용자 기준으로 저장소 키 수집
         repo_keys = set()
         for user_data in scores.values():
@@ -331,26 +453,19 @@ class OutputHandler:
         usernames = [user for user, _ in sorted_users]
 
         # 서수 붙이기 (1st, 2nd, 3rd ...)
-        def get_ordinal_suffix(rank: int) -> str:
-            if rank == 1:
-                return "1st"
-            elif rank == 2:
-                return "2nd"
-            elif rank == 3:
-                return "3rd"
-            else:
-                return f"{rank}th"
-
         ranked_usernames = [f"{user} ({get_ordinal_suffix(score.get('rank', 0))})" for user, score in sorted_users]
 
         usernames = usernames[::-1]
         ranked_usernames = ranked_usernames[::-1]
 
-        # 저장소별 점수 추출
-        scores_by_repo = {
-            repo: [scores[user].get(repo, 0) for user in usernames]
-            for repo in repo_keys
-        }
+        # 사용자×저장소 점수 행렬을 한 번만 만들고 누적합으로 막대 시작 위치를 계산
+        M = np.array(
+            [[scores[user].get(repo, 0) for repo in repo_keys] for user in usernames],
+            dtype=float
+        )
+        lefts = np.zeros_like(M)
+        lefts[:, 1:] = np.cumsum(M[:, :-1], axis=1)
+        totals = M.sum(axis=1)
 
         # 저장소별 색상 지정
         color_map = {
@@ -359,125 +474,90 @@ class OutputHandler:
             "oss2025hnu_reposcore-cs": "#fd8d3c"    # 주황
         }
 
-        bottom = [0] * len(usernames)
-        plt.figure(figsize=(12, max(4, len(usernames) * 0.35)))
+        # 차트 생성 (Figure는 호출 간 재사용)
+        fig, ax = self._get_axes(12, max(4, len(usernames) * 0.35))
 
-        for repo in repo_keys:
+        for j, repo in enumerate(repo_keys):
             color = color_map.get(repo.lower(), "#bbbbbb")
-            plt.barh(usernames, scores_by_repo[repo], left=bottom, label=repo.upper(), color=color)
-            bottom = [b + s for b, s in zip(bottom, scores_by_repo[repo])]
+            ax.barh(usernames, M[:, j], left=lefts[:, j], label=repo.upper(), color=color)
 
         # 막대 옆에 총점 수치 표시
-        for i, user in enumerate(usernames):
-            total_score = sum(scores[user].get(repo, 0) for repo in repo_keys)
-            plt.text(
-                bottom[i] + 1,  # 막대 끝에서 오른쪽으로 1만큼 띄움
-                i,              # y 좌표 (사용자 위치)
+        for i, total_score in enumerate(totals):
+            ax.text(
+                total_score + 1,  # 막대 끝에서 오른쪽으로 1만큼 띄움
+                i,                # y 좌표 (사용자 위치)
                 f"{total_score:.1f}",  # 소수점 1자리로 점수 표시
                 va='center',
                 fontsize=9,
                 color='black'
             )
 
-
-        plt.xlabel("Score")
-        plt.title("Repository Contribution Scores (py/js/cs)")
-        plt.legend(loc="upper right")
-        plt.tight_layout()
-        plt.yticks(range(len(ranked_usernames)), ranked_usernames)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.set_xlabel("Score")
+        ax.set_title("Repository Contribution Scores (py/js/cs)")
+        ax.legend(loc="upper right")
+        ax.set_yticks(range(len(ranked_usernames)), ranked_usernames)
+        fig.tight_layout()
+        fig.savefig(save_path, dpi=self.CHART_CONFIG['dpi'])
 
     def generate_weekly_chart(self, weekly_data: dict[int, dict[str, int]], semester_start_date: date, save_path: str) -> None:
         """주차별 PR/이슈 활동량을 막대그래프로 시각화하여 저장"""
+        if self.dry_run:
+            print(f"[DRY-RUN] 주차별 차트 저장 생략 (예상 경로: {save_path})")
+            return
+        if not weekly_data:
+            logger.warning("주차별 활동 데이터가 없어 차트 생성을 건너뜁니다.")
+            return
+        import numpy as np
+
+        _resolve_korean_font()
 
         weeks = sorted(weekly_data.keys())
-        pr_counts = [weekly_data[w]["pr"] for w in weeks]
-        issue_counts = [weekly_data[w]["issue"] for w in weeks]
+        # 주차별 활동량을 ndarray로 바로 수집 (중간 리스트 없이 bar에 전달)
+        pr_counts = np.fromiter((weekly_data[w]["pr"] for w in weeks), dtype=int, count=len(weeks))
+        issue_counts = np.fromiter((weekly_data[w]["issue"] for w in weeks), dtype=int, count=len(weeks))
 
         x = np.arange(len(weeks))
         width = 0.35  # 막대 너비
 
-        plt.figure(figsize=(10, 4))
-        plt.bar(x - width/2, pr_counts, width, label="PR", color='skyblue')
-        plt.bar(x + width/2, issue_counts, width, label="Issue", color='lightgreen')
-
-        plt.xlabel("Week")
-        plt.ylabel("Count")
-        plt.title("GitHub Activity per Week (PR/Issue)")
-        plt.xticks(x, [f"Week {w}" for w in weeks])
-        plt.legend()
-        plt.tight_layout()
-        plt.savefig(save_path)
-        plt.close()
-
-    def _get_chart_base64(self, chart_path: str) -> str:
-        """차트 이미지를 HTML에 삽입하기 위해 base64로 변환"""
-        import base64
-        with open(chart_path, 'rb') as img_file:
-            return base64.b64encode(img_file.read()).decode('utf-8')
-
-    def _generate_score_table_html(self, scores: dict, repo_name: str) -> str:
-        """점수 테이블 HTML 생성"""
-        # 총점 기준으로 사용자 정렬
-        sorted_scores = dict(sorted(scores.items(), key=lambda x: x[1].get('rank', 0)))
-        
-        html = f"""
-        <div class="table-responsive">
-            <h3>{repo_name} 참여자 점수</h3>
-            <table class="table table-striped table-hover">
-                <thead class="table-dark">
-                    <tr>
-                        <th>순위</th>
-                        <th>이름</th>
-                        <th>총점</th>
-                    </tr>
-                </thead>
-                <tbody>
-        """.format(repo_name=repo_name)
-        
-        sorted_scores = dict(sorted(scores.items(), key=lambda x: x[1].get('rank', 0)))
-        for user, score_data in sorted_scores.items():
-            total_score = score_data.get('total', 0)
-            html += f"""
-                    <tr>
-                        <td>{score_data.get('rank', '-')}</td>
-                        <td>{user}</td>
-                        <td>{total_score:.1f}</td>
-                    </tr>        
-            """
-
-        html += """
-                </tbody>
-            </table>
-        </div>
-        """
-        return html
+        fig, ax = self._get_axes(10, 4)
+        ax.bar(x - width/2, pr_counts, width, label="PR", color='skyblue')
+        ax.bar(x + width/2, issue_counts, width, label="Issue", color='lightgreen')
+
+        ax.set_xlabel("Week")
+        ax.set_ylabel("Count")
+        ax.set_title("GitHub Activity per Week (PR/Issue)")
+        ax.set_xticks(x, [f"Week {w}" for w in weeks])
+        ax.legend()
+        fig.tight_layout()
+        # 확장자가 .svg면 래스터화 없이 벡터로 저장
+        if os.path.splitext(save_path)[1].lower() == '.svg':
+            fig.savefig(save_path)
+        else:
+            fig.savefig(save_path, dpi=self.CHART_CONFIG['dpi'])
 
     def generate_html_report(self, all_repo_data: dict, output_dir: str) -> str:
         """
         모든 저장소에 대한 단일 HTML 보고서 생성
         """
-        import os
-
-        # 출력 디렉토리 생성
-        os.makedirs(output_dir, exist_ok=True)
-
         # HTML 파일 경로 (항상 index.html로 고정)
         html_path = os.path.join(output_dir, "index.html")
 
-        # 탭 헤더와 콘텐츠 초기화
-        tabs_header = []
-        tabs_content = []
+        if self.dry_run:
+            print(f"[DRY-RUN] HTML 보고서 생성 생략 (예상 경로: {html_path})")
+            return html_path
+
+        # 출력 디렉토리 생성
+        os.makedirs(output_dir, exist_ok=True)
 
         # 중복 추가 방지용 집합
         added_tabs = set()
-                
+
         # overall이 존재할 경우 맨 앞의 순서로 변경
         sorted_items = sorted(all_repo_data.items(), key=lambda x: (x[0] != 'overall', x[0]))
 
-        # 각 저장소별로 탭과 콘텐츠 생성
-        for i, (repo_name, repo_data) in enumerate(sorted_items):
+        # 템플릿에 넘길 저장소별 탭 데이터 구성
+        tabs = []
+        for repo_name, repo_data in sorted_items:
             if repo_name in added_tabs:
                 continue  # 중복 방지
 
@@ -492,7 +572,7 @@ class OutputHandler:
                 rel_chart_path = os.path.join(repo_name, os.path.basename(chart_path)) if chart_path else ''
             rel_weekly_chart_path = os.path.join(repo_name, os.path.basename(weekly_chart_path)) if weekly_chart_path else ''
 
-            # CSV 다운로드 버튼 추가
+            # CSV 다운로드 경로
             if repo_name == "overall":
                 csv_path = "overall/ratio_score.csv"
             elif repo_name == "overall_repository":
@@ -500,96 +580,22 @@ class OutputHandler:
             else:
                 csv_path = f"{repo_name}/score.csv"
 
-            download_button = f"""
-            <div class="text-end mt-2 mb-3">
-                <a href="{csv_path}" download class="btn btn-outline-primary">Download Score CSV</a>
-            </div>
-            """
-
-            # 탭 활성화 상태 설정 (첫 번째 탭만 활성화)
-            active_class = "active" if not tabs_header else ""
-
-            # 탭 헤더 추가
-            tabs_header.append(f"""
-            <li class="nav-item">
-                <a class="nav-link {active_class}" id="tab-{repo_name}" data-bs-toggle="tab" href="#content-{repo_name}" role="tab">
-                    {repo_name.replace('_', ' ').title().lower()}
-                </a>
-            </li>
-            """)
-
-            # 차트 이미지 태그 생성
-            chart_img = f'<img src="{rel_chart_path}" class="img-fluid" alt="{repo_name} 차트">' if rel_chart_path else '<p>차트를 사용할 수 없습니다.</p>'
-
-            # 주간 차트 이미지 태그 생성 (있을 경우)
-            weekly_chart_section = ''
-            if rel_weekly_chart_path:
-                weekly_chart_section = f"""
-                <div class="mt-4">
-                    <h4>주간 활동량</h4>
-                    <img src="{rel_weekly_chart_path}" class="img-fluid" alt="{repo_name} 주간 활동량 차트">
-                </div>
-                """
-
-            # 점수 테이블 생성
-            score_table = self._generate_score_table_html(scores, repo_name)
-
-            # 탭 콘텐츠 추가
-            tabs_content.append(f"""
-            <div class="tab-pane fade show {active_class}" id="content-{repo_name}" role="tabpanel">
-                <div class="row">
-                    {download_button}
-                    <div class="col-lg-6">
-                        <h4>기여도 차트</h4>
-                        {chart_img}
-                        {weekly_chart_section}
-                    </div>
-                    <div class="col-lg-6">
-                        {score_table}
-                    </div>
-                </div>
-            </div>
-            """)
-
-            # 중복 추가 방지용으로 집합에 추가
+            tabs.append({
+                'name': repo_name,
+                'label': repo_name.replace('_', ' ').title().lower(),
+                'csv_path': csv_path,
+                'chart_path': rel_chart_path,
+                'weekly_chart_path': rel_weekly_chart_path,
+                'rows': [
+                    {'rank': s.get('rank', '-'), 'user': user, 'total': f"{s.get('total', 0):.1f}"}
+                    for user, s in scores.items()
+                ],
+            })
             added_tabs.add(repo_name)
 
-        # HTML 템플릿
-        timestamp = self.get_kst_timestamp()
-
-        # HTML 생성
-        html = f"""
-        <!DOCTYPE html>
-        <html lang="ko">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>GitHub 저장소 분석 보고서</title>
-            <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        </head>
-        <body>
-            <div class="container">
-                <div class="report-header text-center">
-                    <h1>GitHub 저장소 분석 보고서</h1>
-                    <p class="text-muted">생성 일시: {timestamp}</p>
-                </div>
-                
-                <ul class="nav nav-tabs" id="repoTabs" role="tablist">
-                    {"".join(tabs_header)}
-                </ul>
-                
-                <div class="tab-content" id="repoTabsContent">
-                    {"".join(tabs_content)}
-                </div>
-            </div>
-            
-            <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-        </body>
-        </html>
-        """
-
-        # HTML 파일 저장
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        # 한 번만 컴파일된 템플릿으로 스트리밍 렌더링 (전체 HTML을 메모리에 쌓지 않음)
+        _get_report_template().stream(
+            timestamp=self._report_timestamp(), tabs=tabs
+        ).dump(html_path, encoding='utf-8')
 
         return html_path
@@ -1,16 +1,77 @@
 # reposcore/retry_decorator.py
 
+import random
 import time
 import logging
 from functools import wraps
 import urllib.error
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 logger = logging.getLogger(__name__)
 
+class _MeteredHTTPAdapter(HTTPAdapter):
+    """요청 수·상태 코드 분포·풀 고갈 횟수를 집계하는 HTTPAdapter
+
+    pool_maxsize와 병렬 워커 수를 실측으로 튜닝할 수 있도록 한다. 집계는
+    DEBUG 레벨이 켜져 있을 때만 수행하므로 평소 비용은 레벨 검사 한 번이다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats = {'requests': 0, 'pool_exhaustions': 0, 'status_counts': {}}
+
+    def send(self, request, **kwargs):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return super().send(request, **kwargs)
+        self._stats['requests'] += 1
+        response = super().send(request, **kwargs)
+        counts = self._stats['status_counts']
+        counts[response.status_code] = counts.get(response.status_code, 0) + 1
+        return response
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        conn = super().get_connection_with_tls_context(request, verify, proxies=proxies, cert=cert)
+        # 유휴 연결이 없는 상태에서의 요청 = 풀 미스 (풀 크기가 동시성을 못 따라감)
+        if logger.isEnabledFor(logging.DEBUG) and conn.pool is not None and conn.pool.qsize() == 0:
+            self._stats['pool_exhaustions'] += 1
+        return conn
+
+    def get_stats(self) -> dict:
+        """지금까지의 집계를 복사본으로 반환"""
+        return {
+            'requests': self._stats['requests'],
+            'pool_exhaustions': self._stats['pool_exhaustions'],
+            'status_counts': dict(self._stats['status_counts']),
+        }
+
+def build_session(pool_maxsize: int = 20) -> requests.Session:
+    """커넥션 풀이 설정된 requests.Session을 생성
+
+    같은 세션을 재사용하면 GitHub API 호출 간 TCP/TLS 핸드셰이크를 생략할 수
+    있다. 재시도는 retry 데코레이터가 담당하므로 어댑터 수준 재시도는 끈다.
+    """
+    session = requests.Session()
+    adapter = _MeteredHTTPAdapter(pool_maxsize=pool_maxsize, max_retries=Retry(total=0))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def log_session_stats(session: requests.Session) -> None:
+    """세션 어댑터의 풀 사용 집계를 DEBUG 로그로 출력 (풀 크기 튜닝용)"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    # 같은 어댑터가 http/https 양쪽에 마운트되므로 중복을 제거하고 출력
+    for adapter in dict.fromkeys(session.adapters.values()):
+        get_stats = getattr(adapter, 'get_stats', None)
+        if get_stats is not None:
+            logger.debug(f"커넥션 풀 통계: {get_stats()}")
+
 def retry(
     max_retries: int = 3,
     retry_delay: float = 5,
+    max_delay: float = 60.0,
     exceptions: tuple = (
         requests.exceptions.RequestException,
         requests.exceptions.ConnectionError,
@@ -24,7 +85,8 @@ def retry(
 
     Args:
         max_retries: 최대 재시도 횟수 (기본:3)
-        retry_delay: 재시도 간 대기 시간(초, 기본:5)
+        retry_delay: 첫 재시도 대기 시간(초, 기본:5). 이후 지수적으로 증가
+        max_delay: 재시도 대기 시간 상한(초, 기본:60)
         exceptions: 재시도할 예외 타입 튜플 (기본: requests 관련 주요 예외)
     """
     def decorator(func):
@@ -37,24 +99,33 @@ def retry(
                 except exceptions as e:
                     if retries < max_retries:
                         retries += 1
+                        # 지수 백오프 + 지터: 동시에 실패한 요청들이 같은 시점에 몰려 재시도하는 것을 방지
+                        delay = min(retry_delay * (2 ** (retries - 1)), max_delay) * (0.5 + random.random())
+                        # 서버가 대기 시간을 알려준 경우(429/403/503 등) 그 값을 우선 사용:
+                        # Retry-After가 있으면 그대로, 없으면 X-RateLimit-Reset까지 남은 시간
+                        response = getattr(e, 'response', None)
+                        retry_after = response.headers.get('Retry-After') if response is not None else None
+                        rate_reset = response.headers.get('X-RateLimit-Reset') if response is not None else None
+                        if retry_after:
+                            try:
+                                delay = min(float(retry_after), max_delay)
+                            except ValueError:
+                                pass  # HTTP-date 형식 등 숫자가 아니면 백오프 값 유지
+                        elif rate_reset:
+                            try:
+                                delay = min(max(0.0, int(rate_reset) - time.time()), max_delay)
+                            except ValueError:
+                                pass
                         logger.warning(
-                            f"[{retries}/{max_retries}] {func.__name__}에서 예외 발생: {e}. {retry_delay}s 후 재시도"
+                            f"[{retries}/{max_retries}] {func.__name__}에서 예외 발생: {e}. {delay:.1f}s 후 재시도"
                         )
-                        time.sleep(retry_delay)
+                        time.sleep(delay)
                         continue
+                    # 트레이스백 포맷 비용이 있으므로 DEBUG 레벨일 때만 exc_info를 붙인다
                     logger.error(
-                        f"{func.__name__}에서 {max_retries}회 재시도 후에도 실패: {e}"
+                        f"{func.__name__}에서 {max_retries}회 재시도 후에도 실패: {e}",
+                        exc_info=logger.isEnabledFor(logging.DEBUG)
                     )
                     raise
         return wrapper
     return decorator
-
-# 예시: 실제 요청 함수에 적용
-@retry(max_retries=3, retry_delay=2)
-def retry_request(session, url, params=None, headers=None):
-    """
-    requests.Session을 이용한 GET 요청을 재시도하며 수행
-    """
-    response = session.get(url, params=params, headers=headers)
-    response.raise_for_status()  # 4xx, 5xx 발생 시 HTTPError 발생
-    return response
@@ -3,28 +3,56 @@ import pytest
 from urllib.error import URLError
 
 
-class Dummy:
-    def __init__(self):
-        self.count = 0
-
-    @retry(max_retries=2, retry_delay=0)
-    def flaky(self):
-        self.count += 1
-        if self.count < 2:
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    # 재시도 대기를 no-op으로 치환해 retry_delay 값과 무관하게 테스트가 즉시 끝나게 한다
+    monkeypatch.setattr('reposcore.retry_decorator.time.sleep', lambda *_: None)
+
+
+def _flaky_factory(max_retries, fail_until):
+    """fail_until번째 호출 전까지 실패하는 함수와 호출 횟수 카운터를 생성"""
+    calls = {'count': 0}
+
+    @retry(max_retries=max_retries, retry_delay=1)
+    def flaky():
+        calls['count'] += 1
+        if calls['count'] < fail_until:
             raise URLError(ConnectionResetError())
         return "ok"
 
-def test_retry_decorator_succeeds_on_second_try():
-    d = Dummy()
-    result = d.flaky()
-    assert result == "ok"
-    assert d.count == 2
-
-def test_retry_decorator_gives_up_after_max():
-    d = Dummy()
-    # 최대 2번 시도, 세 번째 호출도 실패하게끔
-    @retry(max_retries=1, retry_delay=0)
-    def always_fail():
-        raise URLError(ConnectionResetError())
+    return flaky, calls
+
+
+@pytest.mark.parametrize("max_retries,fail_until,expected_count", [
+    (2, 2, 2),   # 한 번 실패 후 성공
+    (3, 1, 1),   # 첫 호출부터 성공 (재시도 없음)
+])
+def test_retry_decorator_succeeds(max_retries, fail_until, expected_count):
+    flaky, calls = _flaky_factory(max_retries, fail_until)
+    assert flaky() == "ok"
+    assert calls['count'] == expected_count
+
+
+@pytest.mark.parametrize("max_retries,expected_count", [
+    (1, 2),   # 본 호출 1번 + 재시도 1번
+    (3, 4),   # 본 호출 1번 + 재시도 3번
+])
+def test_retry_decorator_gives_up_after_max(max_retries, expected_count):
+    flaky, calls = _flaky_factory(max_retries, fail_until=99)
     with pytest.raises(URLError):
-        always_fail()
+        flaky()
+    assert calls['count'] == expected_count
+
+
+def test_retry_decorator_does_not_retry_unrecoverable():
+    # 네트워크 예외가 아닌 오류(예: 잘못된 인자)는 재시도 없이 즉시 전파되어야 한다
+    calls = {'count': 0}
+
+    @retry(max_retries=3, retry_delay=1)
+    def bad():
+        calls['count'] += 1
+        raise ValueError("잘못된 입력")
+
+    with pytest.raises(ValueError):
+        bad()
+    assert calls['count'] == 1